@@ -1,5 +1,7 @@
 """This module contains function for AixLib model generation"""
 
+import concurrent.futures
+import functools
 import os
 import warnings
 from mako.template import Template
@@ -58,28 +60,29 @@ def export_multizone(buildings, prj, path=None):
     lookup = TemplateLookup(directories=[utilities.get_full_path(
         os.path.join('data', 'output', 'modelicatemplate'))])
     zone_template_1 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_OneElement"),
+        filename=utilities.get_full_path(os.path.join(
+            "data", "output", "modelicatemplate", "AixLib",
+            "AixLib_ThermalZoneRecord_OneElement")),
         lookup=lookup)
     zone_template_2 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_TwoElement"),
+        filename=utilities.get_full_path(os.path.join(
+            "data", "output", "modelicatemplate", "AixLib",
+            "AixLib_ThermalZoneRecord_TwoElement")),
         lookup=lookup)
     zone_template_3 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_ThreeElement"),
+        filename=utilities.get_full_path(os.path.join(
+            "data", "output", "modelicatemplate", "AixLib",
+            "AixLib_ThermalZoneRecord_ThreeElement")),
         lookup=lookup)
     zone_template_4 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib"
-            "/AixLib_ThermalZoneRecord_FourElement"),
+        filename=utilities.get_full_path(os.path.join(
+            "data", "output", "modelicatemplate", "AixLib",
+            "AixLib_ThermalZoneRecord_FourElement")),
         lookup=lookup)
     model_template = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/AixLib/AixLib_Multizone"),
+        filename=utilities.get_full_path(os.path.join(
+            "data", "output", "modelicatemplate", "AixLib",
+            "AixLib_Multizone")),
         lookup=lookup)
 
     uses = [
@@ -96,6 +99,8 @@ def export_multizone(buildings, prj, path=None):
         addition=None,
         extra=None)
 
+    model_files = []
+
     for i, bldg in enumerate(buildings):
 
         ass_error = "You chose IBPSA calculation, " \
@@ -109,8 +114,7 @@ def export_multizone(buildings, prj, path=None):
         utilities.create_path(utilities.get_full_path(
             os.path.join(bldg_path,
                          bldg.name + "_DataBase")))
-        bldg.library_attr.modelica_set_temp(path=bldg_path)
-        bldg.library_attr.modelica_set_temp_cool(path=bldg_path)
+        bldg.library_attr.modelica_set_temp_all(path=bldg_path)
         bldg.library_attr.modelica_AHU_boundary(
             path=bldg_path)
         bldg.library_attr.modelica_gains_boundary(
@@ -135,31 +139,31 @@ def export_multizone(buildings, prj, path=None):
                                                "the project list.")
                 bldg.building_id = i
 
-        out_file = open(utilities.get_full_path
-                        (os.path.join(bldg_path, bldg.name + ".mo")), 'w')
-
-        out_file.write(model_template.render_unicode(
-            bldg=bldg,
-            weather=bldg.parent.weather_file_path,
-            modelica_info=bldg.parent.modelica_info))
-        out_file.close()
+        model_files.append((
+            utilities.get_full_path(os.path.join(bldg_path, bldg.name + ".mo")),
+            model_template.render_unicode(
+                bldg=bldg,
+                weather=bldg.parent.weather_file_path,
+                modelica_info=bldg.parent.modelica_info)))
 
         zone_path = os.path.join(bldg_path, bldg.name + "_DataBase")
 
         for zone in bldg.thermal_zones:
 
-            out_file = open(utilities.get_full_path(os.path.join(
-                zone_path, bldg.name + '_' + zone.name + '.mo')), 'w')
+            zone_model = ""
             if type(zone.model_attr).__name__ == "OneElement":
-                out_file.write(zone_template_1.render_unicode(zone=zone))
+                zone_model = zone_template_1.render_unicode(zone=zone)
             elif type(zone.model_attr).__name__ == "TwoElement":
-                out_file.write(zone_template_2.render_unicode(zone=zone))
+                zone_model = zone_template_2.render_unicode(zone=zone)
             elif type(zone.model_attr).__name__ == "ThreeElement":
-                out_file.write(zone_template_3.render_unicode(zone=zone))
+                zone_model = zone_template_3.render_unicode(zone=zone)
             elif type(zone.model_attr).__name__ == "FourElement":
-                out_file.write(zone_template_4.render_unicode(zone=zone))
+                zone_model = zone_template_4.render_unicode(zone=zone)
 
-            out_file.close()
+            model_files.append((
+                utilities.get_full_path(os.path.join(
+                    zone_path, bldg.name + '_' + zone.name + '.mo')),
+                zone_model))
 
         _help_package(
             path=zone_path,
@@ -171,6 +175,8 @@ def export_multizone(buildings, prj, path=None):
             addition=bldg.name + "_",
             extra=None)
 
+    _write_files(model_files)
+
     print("Exports can be found here:")
     print(path)
 
@@ -192,8 +198,7 @@ def _help_package(path, name, uses=None, within=None):
 
     """
 
-    package_template = Template(filename=utilities.get_full_path(
-        "data/output/modelicatemplate/package"))
+    package_template = _get_package_template("package")
     out_file = open(
         utilities.get_full_path(os.path.join(path, "package.mo")), 'w')
     out_file.write(package_template.render_unicode(
@@ -224,11 +229,58 @@ def _help_package_order(path, package_list, addition=None, extra=None):
 
     """
 
-    order_template = Template(filename=utilities.get_full_path(
-        "data/output/modelicatemplate/package_order"))
+    order_template = _get_package_template("package_order")
 
     out_file = open(
-        utilities.get_full_path(path + "/" + "package" + ".order"), 'w')
+        utilities.get_full_path(os.path.join(path, "package.order")), 'w')
     out_file.write(order_template.render_unicode
                    (list=package_list, addition=addition, extra=extra))
     out_file.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_package_template(name):
+    """returns the compiled Mako template for package files
+
+    private function, do not call
+
+    package.mo and package.order are written several times per building,
+    thus the templates are only compiled once.
+
+    Parameters
+    ----------
+
+    name : string
+        name of the template, either "package" or "package_order"
+
+    """
+
+    return Template(filename=utilities.get_full_path(
+        os.path.join("data", "output", "modelicatemplate", name)))
+
+
+def _write_files(files):
+    """writes rendered files concurrently
+
+    private function, do not call
+
+    Writing is I/O bound, thus the files of an export are collected and
+    written by a small thread pool once all models are rendered.
+
+    Parameters
+    ----------
+
+    files : list of tuples
+        list of (path, content) tuples, path has to be a full path. If a
+        path occurs several times, the last content is written
+
+    """
+
+    def write_file(path, content):
+        with open(path, 'w', buffering=1 << 20) as out_file:
+            out_file.write(content)
+
+    files = dict(files)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        # consume the results to raise errors of single writes
+        list(executor.map(write_file, files.keys(), files.values()))
@@ -7,11 +7,24 @@ This module contains function to call Templates for IBPSA model generation
 """
 
 import teaser.data.output.aixlib_output as ibpsa_output
+import functools
 import os.path
 import teaser.logic.utilities as utilities
 from mako.template import Template
 from mako.lookup import TemplateLookup
 
+_NUMBER_OF_ELEMENTS = {
+    "OneElement": 1,
+    "TwoElement": 2,
+    "ThreeElement": 3,
+    "FourElement": 4}
+
+_MODEL_TEMPLATES = {
+    1: "IBPSA_OneElement",
+    2: "IBPSA_TwoElements",
+    3: "IBPSA_ThreeElements",
+    4: "IBPSA_FourElements"}
+
 
 def export_ibpsa(
         buildings,
@@ -52,20 +65,6 @@ def export_ibpsa(
         Valid values are 'AixLib' (default), 'Buildings',
         'BuildingSystems' and 'IDEAS'.
 
-     Attributes
-    ----------
-
-    lookup : TemplateLookup object
-        Instance of mako.TemplateLookup to store general functions for templates
-    model_template_1 : Template object
-        Template for ThermalZoneRecord using 1 element model
-    model_template_2 : Template object
-        Template for ThermalZoneRecord using 2 element model
-    model_template_3 : Template object
-        Template for ThermalZoneRecord using 3 element model
-    model_template_4 : Template object
-        Template for ThermalZoneRecord using 4 element model
-
     """
 
     uses = uses = [
@@ -73,25 +72,6 @@ def export_ibpsa(
         library + '(version="' + prj.buildings[-1].library_attr.version[
             library] + '")']
 
-    lookup = TemplateLookup(directories=[utilities.get_full_path(
-        os.path.join('data', 'output', 'modelicatemplate'))])
-    model_template_1 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_OneElement"),
-        lookup=lookup)
-    model_template_2 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_TwoElements"),
-        lookup=lookup)
-    model_template_3 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_ThreeElements"),
-        lookup=lookup)
-    model_template_4 = Template(
-        filename=utilities.get_full_path(
-            "data/output/modelicatemplate/IBPSA/IBPSA_FourElements"),
-        lookup=lookup)
-
     ibpsa_output._help_package(
         path=path,
         name=prj.name,
@@ -103,6 +83,8 @@ def export_ibpsa(
         addition=None,
         extra=None)
 
+    model_files = []
+
     for i, bldg in enumerate(buildings):
 
         ass_error = "You chose AixLib calculation, " \
@@ -111,11 +93,12 @@ def export_ibpsa(
 
         assert bldg.used_library_calc == 'IBPSA', ass_error
 
-        bldg_path = os.path.join(path, bldg.name)
+        bldg_path = utilities.get_full_path(os.path.join(path, bldg.name))
+        zone_path = utilities.get_full_path(
+            os.path.join(bldg_path, bldg.name + "_Models"))
 
-        utilities.create_path(utilities.get_full_path(bldg_path))
-        utilities.create_path(utilities.get_full_path(
-            os.path.join(bldg_path, bldg.name + "_Models")))
+        utilities.create_path(bldg_path)
+        utilities.create_path(zone_path)
 
         ibpsa_output._help_package(
             path=bldg_path,
@@ -128,10 +111,6 @@ def export_ibpsa(
             addition=None,
             extra=bldg.name + "_Models")
 
-        zone_path = os.path.join(
-            bldg_path,
-            bldg.name + "_Models")
-
         for zone in bldg.thermal_zones:
 
             zone.parent.library_attr.file_internal_gains = \
@@ -140,23 +119,11 @@ def export_ibpsa(
                 zone=zone,
                 path=zone_path)
 
-            out_file = open(utilities.get_full_path(os.path.join(
-                zone_path, bldg.name + '_' + zone.name + '.mo')), 'w')
-
-            if type(zone.model_attr).__name__ == "OneElement":
-                out_file.write(model_template_1.render_unicode(zone=zone,
-                                                               library=library))
-            elif type(zone.model_attr).__name__ == "TwoElement":
-                out_file.write(model_template_2.render_unicode(zone=zone,
-                                                               library=library))
-            elif type(zone.model_attr).__name__ == "ThreeElement":
-                out_file.write(model_template_3.render_unicode(zone=zone,
-                                                               library=library))
-            elif type(zone.model_attr).__name__ == "FourElement":
-                out_file.write(model_template_4.render_unicode(zone=zone,
-                                                               library=library))
-
-            out_file.close()
+            model_template = _get_model_template(
+                _NUMBER_OF_ELEMENTS[type(zone.model_attr).__name__])
+            model_files.append((
+                os.path.join(zone_path, bldg.name + '_' + zone.name + '.mo'),
+                model_template.render_unicode(zone=zone, library=library)))
 
         ibpsa_output._help_package(
             path=zone_path,
@@ -168,5 +135,39 @@ def export_ibpsa(
             package_list=bldg.thermal_zones,
             addition=bldg.name + "_")
 
+    ibpsa_output._write_files(model_files)
+
     print("Exports can be found here:")
     print(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_model_template(number_of_elements):
+    """returns the compiled Mako template for a zone model
+
+    private function, do not call
+
+    Templates are only read and compiled once per session, as the export
+    renders one model per thermal zone.
+
+    Parameters
+    ----------
+
+    number_of_elements : int
+        number of elements of the reduced order model (1, 2, 3 or 4)
+
+    Returns
+    ----------
+
+    model_template : Template object
+        Template for IBPSA model using the given number of elements
+
+    """
+
+    lookup = TemplateLookup(directories=[utilities.get_full_path(
+        os.path.join('data', 'output', 'modelicatemplate'))])
+    return Template(
+        filename=utilities.get_full_path(os.path.join(
+            "data", "output", "modelicatemplate", "IBPSA",
+            _MODEL_TEMPLATES[number_of_elements])),
+        lookup=lookup)
@@ -1,9 +1,12 @@
 """This module includes AixLib calculation class."""
 
 import teaser.logic.utilities as utilities
-from itertools import cycle, islice
 import os
-import pandas as pd
+import numpy as np
+
+# Time steps in seconds of an hourly annual profile, as expected by Modelica
+_HOURLY_SECONDS_INDEX = np.arange(3600, 3600 * 8761, 3600)
+_HOURLY_SECONDS_INDEX.flags.writeable = False
 
 
 class AixLib(object):
@@ -73,34 +76,21 @@ class AixLib(object):
         self._calc_surface_area()
 
     def _calc_surface_area(self):
-        """Calculate the total surface area of all surfaces."""
-        surf_area_temp = 0.0
-        for zone in self.parent.thermal_zones:
-            if type(zone.model_attr).__name__ == "OneElement":
-                surf_area_temp += zone.model_attr.area_ow + zone.model_attr.area_win
-            elif type(zone.model_attr).__name__ == "TwoElement":
-                surf_area_temp += (
-                    zone.model_attr.area_ow
-                    + zone.model_attr.area_iw
-                    + zone.model_attr.area_win
-                )
-            elif type(zone.model_attr).__name__ == "ThreeElement":
-                surf_area_temp += (
-                    zone.model_attr.area_ow
-                    + zone.model_attr.area_iw
-                    + zone.model_attr.area_gf
-                    + zone.model_attr.area_win
-                )
-            elif type(zone.model_attr).__name__ == "FourElement":
-                surf_area_temp += (
-                    zone.model_attr.area_ow
-                    + zone.model_attr.area_iw
-                    + zone.model_attr.area_gf
-                    + zone.model_attr.area_rt
-                    + zone.model_attr.area_win
-                )
-
-        self.total_surface_area = surf_area_temp
+        """Calculate the total surface area of all surfaces.
+
+        Each element model lists the areas it considers in _area_attrs (e.g.
+        OneElement has no area_iw).
+        """
+        areas = np.fromiter(
+            (
+                getattr(zone.model_attr, attr)
+                for zone in self.parent.thermal_zones
+                for attr in zone.model_attr._area_attrs
+            ),
+            dtype=np.float64,
+        )
+
+        self.total_surface_area = float(areas.sum())
 
     def modelica_set_temp(self, path=None):
         """Create .txt file for set temperatures for heating.
@@ -114,35 +104,10 @@ class AixLib(object):
             optional path, when matfile is exported separately
 
         """
-        if path is None:
-            path = utilities.get_default_path()
-        else:
-            pass
-
-        utilities.create_path(path)
-        path = os.path.join(path, self.file_set_t_heat)
-
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            columns=[zone.name for zone in self.parent.thermal_zones],
+        self._modelica_set_temp_common(
+            profile="heating_profile", file_name=self.file_set_t_heat, path=path
         )
 
-        for zone_count in self.parent.thermal_zones:
-            export[zone_count.name] = zone_count.use_conditions.schedules[
-                "heating_profile"
-            ]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Tset({}, {})\n".format(8760, len(self.parent.thermal_zones) + 1)
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
-
     def modelica_set_temp_cool(self, path=None):
         """Create .txt file for set temperatures cooling.
 
@@ -150,6 +115,23 @@ class AixLib(object):
         of each zone, that are all saved into one matrix.
 
 
+        Parameters
+        ----------
+        path : str
+            optional path, when matfile is exported separately
+
+        """
+        self._modelica_set_temp_common(
+            profile="cooling_profile", file_name=self.file_set_t_cool, path=path
+        )
+
+    def modelica_set_temp_all(self, path=None):
+        """Create .txt files for set temperatures for heating and cooling.
+
+        This function creates the same files as modelica_set_temp and
+        modelica_set_temp_cool, but collects heating and cooling profiles in
+        one pass over all zones.
+
         Parameters
         ----------
         path : str
@@ -162,28 +144,59 @@ class AixLib(object):
             pass
 
         utilities.create_path(path)
-        path = os.path.join(path, self.file_set_t_cool)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            columns=[zone.name for zone in self.parent.thermal_zones],
+        heating = [_HOURLY_SECONDS_INDEX]
+        cooling = [_HOURLY_SECONDS_INDEX]
+        for zone_count in self.parent.thermal_zones:
+            schedules = zone_count.use_conditions.schedules
+            heating.append(schedules["heating_profile"].values)
+            cooling.append(schedules["cooling_profile"].values)
+
+        _write_table(
+            path=os.path.join(path, self.file_set_t_heat),
+            name="Tset",
+            export=np.column_stack(heating),
+        )
+        _write_table(
+            path=os.path.join(path, self.file_set_t_cool),
+            name="Tset",
+            export=np.column_stack(cooling),
         )
 
-        for zone_count in self.parent.thermal_zones:
-            export[zone_count.name] = zone_count.use_conditions.schedules[
-                "cooling_profile"
+    def _modelica_set_temp_common(self, profile, file_name, path=None):
+        """Create .txt file for set temperatures of the given profile.
+
+        Shared implementation of modelica_set_temp and
+        modelica_set_temp_cool.
+
+        Parameters
+        ----------
+        profile : str
+            Name of the profile in use_conditions.schedules, either
+            heating_profile or cooling_profile
+        file_name : str
+            Filename of the set temperature file
+        path : str
+            optional path, when matfile is exported separately
+
+        """
+        if path is None:
+            path = utilities.get_default_path()
+        else:
+            pass
+
+        utilities.create_path(path)
+        path = os.path.join(path, file_name)
+
+        export = np.column_stack(
+            [_HOURLY_SECONDS_INDEX]
+            + [
+                zone_count.use_conditions.schedules[profile].values
+                for zone_count in self.parent.thermal_zones
             ]
+        )
 
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Tset({}, {})\n".format(8760, len(self.parent.thermal_zones) + 1)
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+        _write_table(path=path, name="Tset", export=export)
 
     def modelica_AHU_boundary(self, path=None):
         """Create .txt file for AHU boundary conditions (building).
@@ -223,25 +236,24 @@ class AixLib(object):
         path = os.path.join(path, self.file_ahu)
 
         if self.parent.with_ahu is True:
-            export = self.parent.central_ahu.schedules
+            schedules = self.parent.central_ahu.schedules
+            profiles = [
+                schedules["temperature_profile"].values,
+                schedules["min_relative_humidity_profile"].values,
+                schedules["max_relative_humidity_profile"].values,
+                schedules["v_flow_profile"].values,
+            ]
         else:  # Dummy values for Input Table
-            export = pd.DataFrame(
-                index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-                .to_series()
-                .dt.strftime("%m-%d %H:%M:%S")
-            )
-
-            export["temperature_profile"] = list(islice(cycle([293.15, 293.15]), 8760))
-            export["min_relative_humidity_profile"] = list(islice(cycle([0, 0]), 8760))
-            export["max_relative_humidity_profile"] = list(islice(cycle([1, 1]), 8760))
-            export["v_flow_profile"] = list(islice(cycle([0, 1]), 8760))
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write("double AHU({}, {})\n".format(8760, 5))
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+            profiles = [
+                np.full(8760, 293.15),
+                np.zeros(8760),
+                np.ones(8760),
+                np.tile([0.0, 1.0], 4380),
+            ]
+
+        export = np.column_stack([_HOURLY_SECONDS_INDEX] + profiles)
+
+        _write_table(path=path, name="AHU", export=export)
 
     def modelica_gains_boundary(self, path=None):
         """Create .txt file for internal gains boundary conditions.
@@ -275,48 +287,41 @@ class AixLib(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_internal_gains)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S")
-        )
-
+        data = [_HOURLY_SECONDS_INDEX]
         for zone_count in self.parent.thermal_zones:
-            export[
-                "person_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["persons_profile"]
-            export[
-                "machines_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["machines_profile"]
-            export[
-                "lighting_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["lighting_profile"]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Internals({}, {})\n".format(
-                    8760, (len(self.parent.thermal_zones) * 3 + 1)
-                )
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
-
-    def _delete_file(self, path):
-        """Delete a file before new information is written to it.
-
-        If a building with the exact name and project name is generated, we need to make
-        sure to delete the old information in the text files. This helper function is a
-        wrapper to delete a file with given filepath.
-
-        Parameters:
-        -----------
-        path : str
-            Absolute path to the file to be deleted.
+            schedules = zone_count.use_conditions.schedules
+            data.append(schedules["persons_profile"].values)
+            data.append(schedules["machines_profile"].values)
+            data.append(schedules["lighting_profile"].values)
 
-        """
-        try:
-            os.remove(path)
-        except OSError:
-            pass
+        export = np.column_stack(data)
+
+        _write_table(path=path, name="Internals", export=export)
+
+
+def _write_table(path, name, export):
+    """Write a matrix as Modelica text table to a file.
+
+    An existing file is overwritten. The first column holds the time steps
+    and is written as integer, all other values are written in their
+    shortest representation.
+
+    Parameters:
+    -----------
+    path : str
+        Absolute path to the file.
+    name : str
+        Name of the table in Modelica, e.g. Tset.
+    export : numpy.ndarray
+        Matrix with the time steps in the first column.
+
+    """
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(b"#1\n")
+        f.write("double {}({}, {})\n".format(name, *export.shape).encode())
+        np.savetxt(
+            f,
+            export,
+            fmt=["%d"] + ["%s"] * (export.shape[1] - 1),
+            delimiter="\t",
+        )
@@ -362,6 +362,9 @@ class FourElement(object):
 
     """
 
+    # areas of all surfaces considered in this model
+    _area_attrs = ("area_ow", "area_iw", "area_gf", "area_rt", "area_win")
+
     def __init__(self, thermal_zone, merge_windows, t_bt):
         """Constructor for TwoElement"""
 
@@ -1,8 +1,12 @@
 """This module includes IBPSA calculation class."""
 
 import os
-import pandas as pd
+import numpy as np
 import teaser.logic.utilities as utilities
+from teaser.logic.buildingobjects.calculation.aixlib import (
+    _HOURLY_SECONDS_INDEX,
+    _write_table,
+)
 
 
 class IBPSA(object):
@@ -83,58 +87,27 @@ class IBPSA(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_internal_gains)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="H")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S")
+        use_conditions = zone.use_conditions
+        persons_profile = use_conditions.schedules["persons_profile"].values
+
+        export = np.column_stack(
+            [
+                _HOURLY_SECONDS_INDEX,
+                persons_profile
+                * (1 - use_conditions.ratio_conv_rad_persons)
+                * use_conditions.fixed_heat_flow_rate_persons
+                * use_conditions.persons
+                * zone.area,
+                persons_profile
+                * use_conditions.ratio_conv_rad_persons
+                * use_conditions.fixed_heat_flow_rate_persons
+                * use_conditions.persons
+                * zone.area,
+                use_conditions.schedules["machines_profile"].values
+                * use_conditions.ratio_conv_rad_machines
+                * use_conditions.machines
+                * zone.area,
+            ]
         )
 
-        export["person_rad_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["persons_profile"]
-            * (1 - zone.use_conditions.ratio_conv_rad_persons)
-            * zone.use_conditions.fixed_heat_flow_rate_persons
-            * zone.use_conditions.persons
-            * zone.area
-        )
-        export["person_conv_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["persons_profile"]
-            * zone.use_conditions.ratio_conv_rad_persons
-            * zone.use_conditions.fixed_heat_flow_rate_persons
-            * zone.use_conditions.persons
-            * zone.area
-        )
-        export["machines_conv_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["machines_profile"]
-            * zone.use_conditions.ratio_conv_rad_machines
-            * zone.use_conditions.machines
-            * zone.area
-        )
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
-        self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Internals({}, {})\n".format(
-                    8760, (len(self.parent.thermal_zones) * 3 + 1)
-                )
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
-
-    def _delete_file(self, path):
-        """Delete a file before new information is written to it.
-
-        If a building with the exact name and project name is generated, we need to make
-        sure to delete the old information in the text files. This helper function is a
-        wrapper to delete a file with given filepath.
-
-        Parameters:
-        -----------
-        path : str
-            Absolute path to the file to be deleted.
-
-        """
-        try:
-            os.remove(path)
-        except OSError:
-            pass
+        _write_table(path=path, name="Internals", export=export)
@@ -213,6 +213,9 @@ class OneElement(object):
 
     """
 
+    # areas of all surfaces considered in this model
+    _area_attrs = ("area_ow", "area_win")
+
     def __init__(self, thermal_zone, merge_windows, t_bt):
         """Constructor for TwoElement"""
 
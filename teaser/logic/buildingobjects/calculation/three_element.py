@@ -288,6 +288,9 @@ class ThreeElement(object):
 
     """
 
+    # areas of all surfaces considered in this model
+    _area_attrs = ("area_ow", "area_iw", "area_gf", "area_win")
+
     def __init__(self, thermal_zone, merge_windows, t_bt):
         """Constructor for ThreeElement"""
 
@@ -249,6 +249,9 @@ class TwoElement(object):
 
     """
 
+    # areas of all surfaces considered in this model
+    _area_attrs = ("area_ow", "area_iw", "area_win")
+
     def __init__(self, thermal_zone, merge_windows, t_bt):
         """Constructor for TwoElement"""
 
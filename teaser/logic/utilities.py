@@ -5,6 +5,7 @@
 classes
 """
 
+import functools
 import os
 import shutil
 import operator
@@ -62,6 +63,7 @@ def get_default_path():
     return teaser_default_path
 
 
+@functools.lru_cache(maxsize=1024)
 def get_full_path(rel_path):
     """Helperfunction to construct pathes to files within teaser.
 
@@ -1194,6 +1194,53 @@ class Test_teaser(object):
         assert round(prj.buildings[-1].volume, 1) == 490.0
         assert round(prj.buildings[-1].sum_heat_load, 4) == 5023.0256
 
+    def test_calc_surface_area_aixlib(self):
+        """test of total_surface_area for all element models"""
+        prj.set_default()
+        helptest.building_test2(prj)
+
+        area_attrs = {
+            1: ("area_ow", "area_win"),
+            2: ("area_ow", "area_iw", "area_win"),
+            3: ("area_ow", "area_iw", "area_gf", "area_win"),
+            4: ("area_ow", "area_iw", "area_gf", "area_rt", "area_win"),
+        }
+        for number_of_elements, attrs in area_attrs.items():
+            prj.buildings[-1].calc_building_parameter(
+                number_of_elements=number_of_elements,
+                merge_windows=False,
+                used_library="AixLib",
+            )
+            area = sum(
+                getattr(zone.model_attr, attr)
+                for zone in prj.buildings[-1].thermal_zones
+                for attr in attrs
+            )
+            assert round(prj.buildings[-1].library_attr.total_surface_area, 4) == (
+                round(area, 4)
+            )
+
+    def test_modelica_set_temp_all(self):
+        """test of modelica_set_temp_all against single set temp exports"""
+        prj.set_default()
+        helptest.building_test2(prj)
+        prj.buildings[-1].calc_building_parameter(
+            number_of_elements=2, merge_windows=False, used_library="AixLib"
+        )
+        library_attr = prj.buildings[-1].library_attr
+        path = os.path.join(utilities.get_default_path(), "SetTemp")
+
+        set_temps = []
+        library_attr.modelica_set_temp_all(path=path)
+        for file_name in (library_attr.file_set_t_heat, library_attr.file_set_t_cool):
+            with open(os.path.join(path, file_name)) as f:
+                set_temps.append(f.read())
+        library_attr.modelica_set_temp(path=path)
+        library_attr.modelica_set_temp_cool(path=path)
+        for file_name in (library_attr.file_set_t_heat, library_attr.file_set_t_cool):
+            with open(os.path.join(path, file_name)) as f:
+                assert f.read() == set_temps.pop(0)
+
     # methods in therm_zone
 
     def test_calc_zone_parameters(self):